@@ -0,0 +1,105 @@
+"""
+In-process caches for board reads.
+
+Board details are cached as encoded JSON response bodies, keyed by board id
+and a per-board version. Every mutation that changes what a board detail
+contains gives the board a new version, so a stale entry is never served and
+is eventually evicted. A read that races a write stores its result under the
+version it started with, which the write has already superseded.
+
+Versions come from one increasing counter and are never reissued. Boards
+without a recorded version share a floor version; when a recorded version is
+dropped (a deleted board, or eviction past MAX_VERSIONED_BOARDS) the floor
+moves past every version issued so far, so no entry stored under an older
+version can match again.
+
+Board existence is also remembered for a short time, so endpoints that only
+need to 404 on a missing board can skip the probe query. Only positive
+answers are cached, and deleting a board forgets it immediately.
+"""
+
+import itertools
+import time
+from collections import OrderedDict
+from uuid import UUID
+
+MAX_CACHED_BOARDS = 256
+MAX_VERSIONED_BOARDS = 10_000
+MAX_KNOWN_BOARDS = 10_000
+BOARD_EXISTS_TTL = 60.0
+
+_version_counter = itertools.count(1)
+_floor_version = 0
+_board_versions: OrderedDict[UUID, int] = OrderedDict()
+_board_details: OrderedDict[tuple[UUID, int], bytes] = OrderedDict()
+_known_boards: OrderedDict[UUID, float] = OrderedDict()
+
+
+def board_version(board_id: UUID) -> int:
+    """Return the current cache version of a board."""
+    return _board_versions.get(board_id, _floor_version)
+
+
+def get_board_detail(board_id: UUID, version: int) -> bytes | None:
+    """Return the cached detail body for a board at the given version, if any."""
+    key = (board_id, version)
+    detail = _board_details.get(key)
+    if detail is not None:
+        _board_details.move_to_end(key)
+    return detail
+
+
+def set_board_detail(board_id: UUID, version: int, detail: bytes) -> None:
+    """Cache the detail body for a board as read at the given version."""
+    _board_details[(board_id, version)] = detail
+    _board_details.move_to_end((board_id, version))
+    while len(_board_details) > MAX_CACHED_BOARDS:
+        _board_details.popitem(last=False)
+
+
+def invalidate_board(board_id: UUID) -> None:
+    """Give a board a new version after a mutation has been committed."""
+    _board_versions[board_id] = next(_version_counter)
+    _board_versions.move_to_end(board_id)
+    if len(_board_versions) > MAX_VERSIONED_BOARDS:
+        _board_versions.popitem(last=False)
+        _raise_floor_version()
+
+
+def discard_board(board_id: UUID) -> None:
+    """Drop the version and cached details of a deleted board."""
+    _board_versions.pop(board_id, None)
+    for key in [key for key in _board_details if key[0] == board_id]:
+        del _board_details[key]
+    _raise_floor_version()
+
+
+def _raise_floor_version() -> None:
+    # Boards without a recorded version now get a version newer than any
+    # entry stored so far, including one stored by a read racing a delete
+    global _floor_version
+    _floor_version = next(_version_counter)
+
+
+def board_known_to_exist(board_id: UUID) -> bool:
+    """Return True if the board was seen to exist within the TTL."""
+    expires_at = _known_boards.get(board_id)
+    if expires_at is None:
+        return False
+    if expires_at < time.monotonic():
+        del _known_boards[board_id]
+        return False
+    return True
+
+
+def remember_board_exists(board_id: UUID) -> None:
+    """Record that a board exists, for BOARD_EXISTS_TTL seconds."""
+    _known_boards[board_id] = time.monotonic() + BOARD_EXISTS_TTL
+    _known_boards.move_to_end(board_id)
+    while len(_known_boards) > MAX_KNOWN_BOARDS:
+        _known_boards.popitem(last=False)
+
+
+def forget_board(board_id: UUID) -> None:
+    """Drop a deleted board from the existence cache."""
+    _known_boards.pop(board_id, None)
@@ -1,38 +1,171 @@
+import asyncio
+import logging
+import os
+import time
 from typing import AsyncGenerator
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.models import Base
 
 DATABASE_URL = "sqlite+aiosqlite:///./baudboard.db"
+READ_ONLY_DATABASE_URL = "sqlite+aiosqlite:///file:./baudboard.db?mode=ro&uri=true"
 
-# Create async engine
-engine = create_async_engine(
+# Per-connection SQLite settings: WAL lets readers proceed while a writer is
+# active, and the larger page cache / in-memory temp store cut disk I/O.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA foreign_keys=ON",
+)
+
+# Pool settings shared by both engines: keep connections (and with them
+# SQLite's per-connection page cache) alive across requests instead of
+# reopening the database file.
+POOL_OPTIONS = {
+    "poolclass": AsyncAdaptedQueuePool,
+    "pool_pre_ping": True,
+    "pool_recycle": 3600,
+}
+
+# Writer engine: SQLite only allows one writer at a time, so a single pooled
+# connection doubles as the application-level write mutex.
+write_engine = create_async_engine(
     DATABASE_URL,
     echo=False,
     future=True,
+    pool_size=1,
+    max_overflow=0,
+    connect_args={"timeout": 30, "check_same_thread": False},
+    **POOL_OPTIONS,
+)
+
+# Reader engine: read-only connections that never queue behind writers.
+read_engine = create_async_engine(
+    READ_ONLY_DATABASE_URL,
+    echo=False,
+    future=True,
+    pool_size=10,
+    max_overflow=20,
+    connect_args={"timeout": 30, "check_same_thread": False},
+    **POOL_OPTIONS,
+)
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Apply SQLITE_PRAGMAS to every new DBAPI connection."""
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+for _engine in (write_engine, read_engine):
+    event.listen(_engine.sync_engine, "connect", _set_sqlite_pragmas)
+
+
+# Set DEBUG_SQL to log every statement with its duration, which makes new
+# N+1 query patterns visible during development.
+sql_logger = logging.getLogger("app.sql")
+
+
+def _start_query_timer(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _log_query(conn, cursor, statement, parameters, context, executemany) -> None:
+    elapsed = time.perf_counter() - conn.info["query_start_time"].pop()
+    sql_logger.debug("%.2fms %s", elapsed * 1000, statement)
+
+
+def _discard_query_timer(context) -> None:
+    # after_cursor_execute does not run for a failed statement, so drop its
+    # start time here instead of leaving it on the stack
+    if context.connection is not None:
+        start_times = context.connection.info.get("query_start_time")
+        if start_times:
+            start_times.pop()
+
+
+if os.getenv("DEBUG_SQL"):
+    sql_logger.setLevel(logging.DEBUG)
+    sql_logger.addHandler(logging.StreamHandler())
+    for _engine in (write_engine, read_engine):
+        event.listen(_engine.sync_engine, "before_cursor_execute", _start_query_timer)
+        event.listen(_engine.sync_engine, "after_cursor_execute", _log_query)
+        event.listen(_engine.sync_engine, "handle_error", _discard_query_timer)
+
+
+@event.listens_for(write_engine.sync_engine, "connect")
+def _disable_driver_begin(dbapi_connection, connection_record) -> None:
+    """Stop the driver from emitting its own deferred BEGIN."""
+    dbapi_connection.isolation_level = None
+
+
+@event.listens_for(write_engine.sync_engine, "begin")
+def _begin_immediate(conn) -> None:
+    """Take the write lock up front so concurrent writers wait on busy_timeout
+    instead of failing with SQLITE_BUSY when a deferred transaction upgrades."""
+    conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+
+# Serializes write sessions within this process, so multi-statement writes
+# run one after another instead of relying on SQLite busy retries.
+WRITE_LOCK = asyncio.Lock()
+
+# Create async session factories. Autoflush is off: pending changes are
+# written at commit (or an explicit flush), so queries issued while building
+# a change never flush it early. Handlers that need generated values before
+# commit must call flush() themselves.
+write_session_maker = async_sessionmaker(
+    write_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autoflush=False,
+    future=True,
 )
 
-# Create async session factory
-async_session_maker = async_sessionmaker(
-    engine,
+read_session_maker = async_sessionmaker(
+    read_engine,
     class_=AsyncSession,
     expire_on_commit=False,
+    autoflush=False,
     future=True,
 )
 
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """Dependency for getting database session in FastAPI routes."""
-    async with async_session_maker() as session:
+async def get_write_db() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency for a read-write database session in FastAPI routes."""
+    async with WRITE_LOCK:
+        async with write_session_maker() as session:
+            yield session
+
+
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency for a read-only database session in FastAPI routes."""
+    async with read_session_maker() as session:
         yield session
 
 
+def _create_schema(connection) -> None:
+    Base.metadata.create_all(connection)
+    # create_all skips the indexes of tables that already exist, so add any
+    # declared since the database file was first created
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
+
+
 async def create_tables() -> None:
-    """Create all tables in the database."""
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    """Create all tables and any missing indexes in the database."""
+    async with write_engine.begin() as conn:
+        await conn.run_sync(_create_schema)
@@ -1,8 +1,27 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
-from routers import boards, columns, cards
 
-app = FastAPI()
+from app.database import create_tables
+from app.responses import ORJSONResponse
+from app.routers import boards, cards, columns, labels
+from app.schemas import BoardDetailResponse, CardResponse, ColumnResponse, LabelResponse
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create database tables and build response schemas once on startup."""
+    await create_tables()
+    # Response schemas are deferred; build the ones routes serialize before
+    # accepting traffic. Request schemas are built when routes are registered.
+    for model in (LabelResponse, CardResponse, ColumnResponse, BoardDetailResponse):
+        model.model_rebuild()
+    yield
+
+
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 app.include_router(boards.router)
 app.include_router(columns.router)
-app.include_router(cards.router)
\ No newline at end of file
+app.include_router(cards.router)
+app.include_router(labels.router)
@@ -1,9 +1,18 @@
+import os
+import time
 from datetime import datetime
-from uuid import uuid4
-from sqlalchemy import JSON, DateTime, ForeignKey, String, Text, func
-from sqlalchemy.dialects.sqlite import UUID
+from uuid import UUID
+from sqlalchemy import DateTime, Float, ForeignKey, Index, String, Text, Uuid, func
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
+def uuid7() -> UUID:
+    """Return a time-ordered UUIDv7 so new rows append to the primary key index."""
+    unix_ms = time.time_ns() // 1_000_000
+    value = (unix_ms << 80) | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return UUID(int=value)
+
 class Base(DeclarativeBase):
     """Base class for all ORM models."""
     pass
@@ -11,46 +20,61 @@ class Base(DeclarativeBase):
 class Board(Base):
     """Kanban board model."""
     __tablename__ = "boards"
-    id: Mapped[str] = mapped_column(UUID(as_uuid=False), primary_key=True, default=lambda: str(uuid4()))
+    __mapper_args__ = {"eager_defaults": True}
+    id: Mapped[UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
     name: Mapped[str] = mapped_column(String, nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), nullable=False)
     updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
-    columns: Mapped[list["Column"]] = relationship("Column", back_populates="board", cascade="all, delete-orphan", lazy="selectin")
-    cards: Mapped[list["Card"]] = relationship("Card", back_populates="board", cascade="all, delete-orphan", lazy="selectin")
-    labels: Mapped[list["Label"]] = relationship("Label", back_populates="board", cascade="all, delete-orphan", lazy="selectin")
+    columns: Mapped[list["Column"]] = relationship("Column", back_populates="board", order_by="Column.position", cascade="all, delete-orphan", passive_deletes=True, lazy="raise_on_sql")
+    cards: Mapped[list["Card"]] = relationship("Card", back_populates="board", cascade="all, delete-orphan", passive_deletes=True, lazy="raise_on_sql")
+    labels: Mapped[list["Label"]] = relationship("Label", back_populates="board", cascade="all, delete-orphan", passive_deletes=True, lazy="raise_on_sql")
 
 class Column(Base):
     """Board column model."""
     __tablename__ = "columns"
-    id: Mapped[str] = mapped_column(UUID(as_uuid=False), primary_key=True, default=lambda: str(uuid4()))
-    board_id: Mapped[str] = mapped_column(UUID(as_uuid=False), ForeignKey("boards.id", ondelete="CASCADE"), nullable=False)
+    __table_args__ = (Index("ix_columns_board_position", "board_id", "position"),)
+    id: Mapped[UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
+    board_id: Mapped[UUID] = mapped_column(Uuid, ForeignKey("boards.id", ondelete="CASCADE"), nullable=False)
     name: Mapped[str] = mapped_column(String, nullable=False)
     position: Mapped[int] = mapped_column(nullable=False)
     color: Mapped[str] = mapped_column(String, default="#6B7280", nullable=False)
     board: Mapped["Board"] = relationship("Board", back_populates="columns")
-    cards: Mapped[list["Card"]] = relationship("Card", back_populates="column", cascade="all, delete-orphan", lazy="selectin")
+    cards: Mapped[list["Card"]] = relationship("Card", back_populates="column", order_by="Card.position", cascade="all, delete-orphan", passive_deletes=True, lazy="raise_on_sql")
 
 class Card(Base):
     """Card/task model."""
     __tablename__ = "cards"
-    id: Mapped[str] = mapped_column(UUID(as_uuid=False), primary_key=True, default=lambda: str(uuid4()))
-    board_id: Mapped[str] = mapped_column(UUID(as_uuid=False), ForeignKey("boards.id", ondelete="CASCADE"), nullable=False)
-    column_id: Mapped[str] = mapped_column(UUID(as_uuid=False), ForeignKey("columns.id", ondelete="CASCADE"), nullable=False)
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        Index("ix_cards_column_position", "column_id", "position"),
+        Index("ix_cards_board_column", "board_id", "column_id"),
+    )
+    id: Mapped[UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
+    board_id: Mapped[UUID] = mapped_column(Uuid, ForeignKey("boards.id", ondelete="CASCADE"), nullable=False)
+    column_id: Mapped[UUID] = mapped_column(Uuid, ForeignKey("columns.id", ondelete="CASCADE"), nullable=False)
     title: Mapped[str] = mapped_column(String, nullable=False)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
-    position: Mapped[int] = mapped_column(nullable=False)
+    position: Mapped[float] = mapped_column(Float, nullable=False)
     priority: Mapped[str] = mapped_column(String, default="none", nullable=False)
-    labels: Mapped[list] = mapped_column(JSON, default=[], nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), nullable=False)
     updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
     column: Mapped["Column"] = relationship("Column", back_populates="cards")
     board: Mapped["Board"] = relationship("Board", back_populates="cards")
+    labels: Mapped[list["Label"]] = relationship("Label", secondary="card_labels", passive_deletes=True, lazy="raise_on_sql")
+
+class CardLabel(Base):
+    """Association between cards and the board labels applied to them."""
+    __tablename__ = "card_labels"
+    __table_args__ = (Index("ix_card_labels_label", "label_id"),)
+    card_id: Mapped[UUID] = mapped_column(Uuid, ForeignKey("cards.id", ondelete="CASCADE"), primary_key=True)
+    label_id: Mapped[UUID] = mapped_column(Uuid, ForeignKey("labels.id", ondelete="CASCADE"), primary_key=True)
 
 class Label(Base):
     """Label/tag model."""
     __tablename__ = "labels"
-    id: Mapped[str] = mapped_column(UUID(as_uuid=False), primary_key=True, default=lambda: str(uuid4()))
-    board_id: Mapped[str] = mapped_column(UUID(as_uuid=False), ForeignKey("boards.id", ondelete="CASCADE"), nullable=False)
+    __table_args__ = (Index("uq_labels_board_name", "board_id", "name", unique=True),)
+    id: Mapped[UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
+    board_id: Mapped[UUID] = mapped_column(Uuid, ForeignKey("boards.id", ondelete="CASCADE"), nullable=False)
     name: Mapped[str] = mapped_column(String, nullable=False)
     color: Mapped[str] = mapped_column(String, nullable=False)
     board: Mapped["Board"] = relationship("Board", back_populates="labels")
\ No newline at end of file
@@ -0,0 +1,28 @@
+"""
+JSON responses that skip FastAPI's jsonable_encoder pass.
+
+ORJSONResponse renders plain dicts built from database rows; orjson
+serializes UUIDs and datetimes natively. ModelResponse renders a pydantic
+model with its own serializer, so nested models are never converted to
+intermediate Python dicts.
+"""
+
+import orjson
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse that renders its content with orjson."""
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
+
+
+class ModelResponse(Response):
+    """Response that renders a pydantic model with model_dump_json."""
+
+    media_type = "application/json"
+
+    def render(self, content: BaseModel) -> bytes:
+        return content.model_dump_json().encode("utf-8")
@@ -1,19 +1,28 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy import delete, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
-
-from app.database import get_db
-from app.models import Board, Column, Card
+from sqlalchemy.orm import raiseload, selectinload
+
+from app.cache import (
+    board_version,
+    discard_board,
+    forget_board,
+    get_board_detail,
+    invalidate_board,
+    set_board_detail,
+)
+from app.database import get_read_db, get_write_db
+from app.models import Board, Column, Card, uuid7
+from app.responses import ModelResponse, ORJSONResponse
 from app.schemas import (
     BoardCreate,
     BoardUpdate,
     BoardResponse,
     BoardDetailResponse,
     ColumnResponse,
-    CardResponse,
 )
 
 router = APIRouter(prefix="/api/boards", tags=["boards"])
@@ -27,84 +36,132 @@ DEFAULT_COLUMNS = [
 ]
 
 
-@router.post("", status_code=status.HTTP_201_CREATED, response_model=BoardDetailResponse)
+def _board_detail_dict(board: Board) -> dict:
+    """
+    Build the detail response body for a board loaded with columns, cards and
+    labels. The rows are trusted, so the body is a plain dict that orjson can
+    render without a pydantic pass; its shape is BoardDetailResponse.
+    """
+    # Columns and cards are already ordered by position (relationship order_by)
+    return {
+        "id": board.id,
+        "name": board.name,
+        "created_at": board.created_at,
+        "updated_at": board.updated_at,
+        "columns": [
+            {
+                "id": col.id,
+                "board_id": col.board_id,
+                "name": col.name,
+                "position": col.position,
+                "color": col.color,
+                "cards": [
+                    {
+                        "id": card.id,
+                        "board_id": card.board_id,
+                        "column_id": card.column_id,
+                        "title": card.title,
+                        "description": card.description,
+                        "position": card.position,
+                        "priority": card.priority,
+                        "labels": [
+                            {"id": label.id, "name": label.name, "color": label.color}
+                            for label in card.labels
+                        ],
+                        "created_at": card.created_at,
+                        "updated_at": card.updated_at,
+                    }
+                    for card in col.cards
+                ],
+            }
+            for col in board.columns
+        ],
+    }
+
+
+@router.post(
+    "",
+    status_code=status.HTTP_201_CREATED,
+    response_model=None,
+    responses={201: {"model": BoardDetailResponse}},
+)
 async def create_board(
     board_data: BoardCreate,
-    db: AsyncSession = Depends(get_db),
-) -> BoardDetailResponse:
+    db: AsyncSession = Depends(get_write_db),
+) -> ModelResponse:
     """Create a new board with 4 default columns."""
     # Create the board
     board = Board(name=board_data.name)
     db.add(board)
     await db.flush()  # Flush to get the board ID
 
-    # Create default columns
-    columns = []
-    for col_spec in DEFAULT_COLUMNS:
-        column = Column(
-            board_id=board.id,
-            name=col_spec["name"],
-            color=col_spec["color"],
-            position=col_spec["position"],
-        )
-        db.add(column)
-        columns.append(column)
+    # Create default columns with a single bulk INSERT; ids are generated
+    # here so the response can be built without reading the rows back
+    columns = [
+        {"id": uuid7(), "board_id": board.id, **col_spec}
+        for col_spec in DEFAULT_COLUMNS
+    ]
+    await db.execute(insert(Column), columns)
 
     await db.commit()
-    await db.refresh(board)
 
-    # Build response
-    return BoardDetailResponse(
+    # Build response; created_at/updated_at came back from the INSERT via
+    # RETURNING (eager_defaults), so no refresh is needed
+    detail = BoardDetailResponse.model_construct(
         id=board.id,
         name=board.name,
         created_at=board.created_at,
         updated_at=board.updated_at,
-        columns=[
-            ColumnResponse(
-                id=col.id,
-                board_id=col.board_id,
-                name=col.name,
-                position=col.position,
-                color=col.color,
-                cards=[],
-            )
-            for col in columns
-        ],
+        columns=[ColumnResponse.model_construct(**col, cards=[]) for col in columns],
     )
+    return ModelResponse(detail, status_code=status.HTTP_201_CREATED)
 
 
-@router.get("", response_model=list[BoardResponse])
+@router.get(
+    "",
+    response_model=None,
+    responses={200: {"model": list[BoardResponse]}},
+)
 async def list_boards(
-    db: AsyncSession = Depends(get_db),
-) -> list[BoardResponse]:
+    db: AsyncSession = Depends(get_read_db),
+) -> ORJSONResponse:
     """List all boards."""
-    result = await db.execute(select(Board).order_by(Board.created_at))
-    boards = result.scalars().all()
-    return [
-        BoardResponse(
-            id=b.id,
-            name=b.name,
-            created_at=b.created_at,
-        )
-        for b in boards
-    ]
+    result = await db.execute(
+        select(Board.id, Board.name, Board.created_at).order_by(Board.created_at)
+    )
+    return ORJSONResponse(
+        [
+            {"id": row.id, "name": row.name, "created_at": row.created_at}
+            for row in result.all()
+        ]
+    )
 
 
-@router.get("/{board_id}", response_model=BoardDetailResponse)
+@router.get(
+    "/{board_id}",
+    response_model=None,
+    responses={200: {"model": BoardDetailResponse}},
+)
 async def get_board(
     board_id: UUID,
-    db: AsyncSession = Depends(get_db),
-) -> BoardDetailResponse:
+    db: AsyncSession = Depends(get_read_db),
+) -> Response:
     """Get a single board with all its columns and cards."""
-    # Convert UUID to string for database query
-    board_id_str = str(board_id)
+    # Serve from the cache unless the board changed since it was stored
+    version = board_version(board_id)
+    cached = get_board_detail(board_id, version)
+    if cached is not None:
+        return Response(cached, media_type="application/json")
 
     # Fetch board with columns and cards eagerly loaded
     result = await db.execute(
         select(Board)
-        .where(Board.id == board_id_str)
+        .where(Board.id == board_id)
         .options(
-            selectinload(Board.columns).selectinload(Column.cards)
+            selectinload(Board.columns)
+            .selectinload(Column.cards)
+            .selectinload(Card.labels),
+            raiseload("*"),
         )
     )
     board = result.unique().scalar_one_or_none()
@@ -115,61 +172,33 @@ async def get_board(
             detail="Board not found",
         )
 
-    # Sort columns by position
-    sorted_columns = sorted(board.columns, key=lambda c: c.position)
-
-    # Build the response
-    columns_response = [
-        ColumnResponse(
-            id=col.id,
-            board_id=col.board_id,
-            name=col.name,
-            position=col.position,
-            color=col.color,
-            cards=[
-                CardResponse(
-                    id=card.id,
-                    board_id=card.board_id,
-                    column_id=card.column_id,
-                    title=card.title,
-                    description=card.description,
-                    position=card.position,
-                    priority=card.priority,
-                    labels=card.labels or [],
-                    created_at=card.created_at,
-                    updated_at=card.updated_at,
-                )
-                for card in sorted(col.cards, key=lambda c: c.position)
-            ],
-        )
-        for col in sorted_columns
-    ]
+    # Cache the encoded body, so a hit is served without building or
+    # serializing anything
+    body = orjson.dumps(_board_detail_dict(board))
+    set_board_detail(board_id, version, body)
+    return Response(body, media_type="application/json")
 
-    return BoardDetailResponse(
-        id=board.id,
-        name=board.name,
-        created_at=board.created_at,
-        updated_at=board.updated_at,
-        columns=columns_response,
-    )
 
-
-@router.put("/{board_id}", response_model=BoardDetailResponse)
+@router.put(
+    "/{board_id}",
+    response_model=None,
+    responses={200: {"model": BoardDetailResponse}},
+)
 async def update_board(
     board_id: UUID,
     board_data: BoardUpdate,
-    db: AsyncSession = Depends(get_db),
-) -> BoardDetailResponse:
+    db: AsyncSession = Depends(get_write_db),
+) -> ORJSONResponse:
     """Update board name."""
-    # Convert UUID to string for database query
-    board_id_str = str(board_id)
-
     # Fetch board with columns and cards
     result = await db.execute(
         select(Board)
-        .where(Board.id == board_id_str)
+        .where(Board.id == board_id)
         .options(
-            selectinload(Board.columns).selectinload(Column.cards)
+            selectinload(Board.columns)
+            .selectinload(Column.cards)
+            .selectinload(Card.labels),
+            raiseload("*"),
         )
     )
     board = result.unique().scalar_one_or_none()
@@ -183,64 +212,26 @@ async def update_board(
     # Update the board name
     board.name = board_data.name
     await db.commit()
-    await db.refresh(board)
-
-    # Sort columns by position
-    sorted_columns = sorted(board.columns, key=lambda c: c.position)
-
-    # Build the response
-    columns_response = [
-        ColumnResponse(
-            id=col.id,
-            board_id=col.board_id,
-            name=col.name,
-            position=col.position,
-            color=col.color,
-            cards=[
-                CardResponse(
-                    id=card.id,
-                    board_id=card.board_id,
-                    column_id=card.column_id,
-                    title=card.title,
-                    description=card.description,
-                    position=card.position,
-                    priority=card.priority,
-                    labels=card.labels or [],
-                    created_at=card.created_at,
-                    updated_at=card.updated_at,
-                )
-                for card in sorted(col.cards, key=lambda c: c.position)
-            ],
-        )
-        for col in sorted_columns
-    ]
+    invalidate_board(board_id)
 
-    return BoardDetailResponse(
-        id=board.id,
-        name=board.name,
-        created_at=board.created_at,
-        updated_at=board.updated_at,
-        columns=columns_response,
-    )
+    return ORJSONResponse(_board_detail_dict(board))
 
 
 @router.delete("/{board_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_board(
     board_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_write_db),
 ) -> None:
     """Delete a board and cascade delete all its columns and cards."""
-    # Convert UUID to string for database query
-    board_id_str = str(board_id)
+    # Columns, cards and labels are removed by the ON DELETE CASCADE foreign keys
+    result = await db.execute(delete(Board).where(Board.id == board_id))
 
-    result = await db.execute(select(Board).where(Board.id == board_id_str))
-    board = result.scalar_one_or_none()
-
-    if not board:
+    if result.rowcount == 0:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Board not found",
         )
 
-    await db.delete(board)
     await db.commit()
+    discard_board(board_id)
+    forget_board(board_id)
@@ -1,83 +1,159 @@
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import case, delete, func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
-from app.database import get_db
-from app.models import Card, Column
+from app.cache import invalidate_board
+from app.database import get_read_db, get_write_db
+from app.models import Card, CardLabel, Column, Label
+from app.responses import ModelResponse
 from app.schemas import CardCreate, CardUpdate, CardMove, CardResponse
 
 router = APIRouter(prefix="/api/cards", tags=["cards"])
 
+# Card positions are sparse float keys: a moved card takes the midpoint between
+# its new neighbours, so no other rows are rewritten. When two neighbours get
+# too close to split, the column is renumbered once.
+MIN_POSITION_GAP = 1e-6
 
-@router.post("", status_code=status.HTTP_201_CREATED, response_model=CardResponse)
+
+async def _renumber_column(
+    db: AsyncSession, column_id: UUID, card_id: UUID, index: int
+) -> None:
+    """Reset the other cards in a column to whole-number positions, leaving
+    position `index` free for the card being moved."""
+    result = await db.execute(
+        select(Card.id)
+        .where(Card.column_id == column_id)
+        .where(Card.id != card_id)
+        .order_by(Card.position)
+    )
+    card_ids = result.scalars().all()
+    await db.execute(
+        update(Card)
+        .where(Card.id.in_(card_ids))
+        .values(
+            position=case(
+                *(
+                    (Card.id == other_id, i if i < index else i + 1)
+                    for i, other_id in enumerate(card_ids)
+                )
+            )
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def _position_at(
+    db: AsyncSession, column_id: UUID, card_id: UUID, index: int
+) -> float:
+    """Return a position key that places a card at `index` among the other
+    cards of a column, reading only the two neighbouring positions."""
+    siblings = (
+        select(Card.position)
+        .where(Card.column_id == column_id)
+        .where(Card.id != card_id)
+        .order_by(Card.position)
+    )
+
+    if index <= 0:
+        result = await db.execute(siblings.limit(1))
+        first = result.scalar_one_or_none()
+        return 0.0 if first is None else first - 1
+
+    result = await db.execute(siblings.offset(index - 1).limit(2))
+    neighbours = result.scalars().all()
+
+    if not neighbours:
+        # Index is past the end of the column: append after the last card
+        result = await db.execute(
+            select(func.max(Card.position))
+            .where(Card.column_id == column_id)
+            .where(Card.id != card_id)
+        )
+        last = result.scalar_one()
+        return 0.0 if last is None else last + 1
+
+    if len(neighbours) == 1:
+        return neighbours[0] + 1
+
+    before, after = neighbours
+    if after - before < MIN_POSITION_GAP:
+        await _renumber_column(db, column_id, card_id, index)
+        return float(index)
+    return (before + after) / 2
+
+
+@router.post(
+    "",
+    status_code=status.HTTP_201_CREATED,
+    response_model=None,
+    responses={201: {"model": CardResponse}},
+)
 async def create_card(
     card_data: CardCreate,
-    db: AsyncSession = Depends(get_db),
-) -> CardResponse:
+    db: AsyncSession = Depends(get_write_db),
+) -> ModelResponse:
     """Create a new card in a column."""
-    # Convert UUID to string for database query
-    column_id_str = str(card_data.column_id)
+    column_id = card_data.column_id
     
-    # Check if column exists
-    result = await db.execute(select(Column).where(Column.id == column_id_str))
-    column = result.scalar_one_or_none()
+    # Check if column exists, fetching only the board it belongs to
+    result = await db.execute(select(Column.board_id).where(Column.id == column_id))
+    board_id = result.scalar_one_or_none()
     
-    if not column:
+    if board_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Column not found",
         )
     
-    # Get the current max position in the column
-    result = await db.execute(
-        select(Card)
-        .where(Card.column_id == column_id_str)
-        .order_by(Card.position.desc())
+    # Insert the card at the end of the column; the position is computed
+    # inside the INSERT so the read and the write cannot interleave
+    next_position = (
+        select(func.coalesce(func.max(Card.position), -1) + 1)
+        .where(Card.column_id == column_id)
+        .scalar_subquery()
     )
-    cards = result.scalars().all()
-    max_position = cards[0].position if cards else -1
-    
-    # Create the card
-    card = Card(
-        board_id=column.board_id,
-        column_id=column_id_str,
-        title=card_data.title,
-        description=card_data.description,
-        position=max_position + 1,
-        priority=card_data.priority or "none",
-        labels=card_data.labels or [],
+    result = await db.execute(
+        insert(Card)
+        .values(
+            board_id=board_id,
+            column_id=column_id,
+            title=card_data.title,
+            description=card_data.description,
+            position=next_position,
+        )
+        .returning(Card)
     )
+    card = result.scalar_one()
+    set_committed_value(card, "labels", [])
     
-    db.add(card)
     await db.commit()
-    await db.refresh(card)
+    invalidate_board(board_id)
     
-    return CardResponse(
-        id=card.id,
-        board_id=card.board_id,
-        column_id=card.column_id,
-        title=card.title,
-        description=card.description,
-        position=card.position,
-        priority=card.priority,
-        labels=card.labels or [],
-        created_at=card.created_at,
-        updated_at=card.updated_at,
+    return ModelResponse(
+        CardResponse.from_orm_fast(card), status_code=status.HTTP_201_CREATED
     )
 
 
-@router.get("/{card_id}", response_model=CardResponse)
+@router.get(
+    "/{card_id}",
+    response_model=None,
+    responses={200: {"model": CardResponse}},
+)
 async def get_card(
     card_id: UUID,
-    db: AsyncSession = Depends(get_db),
-) -> CardResponse:
+    db: AsyncSession = Depends(get_read_db),
+) -> ModelResponse:
     """Get a single card by ID."""
-    # Convert UUID to string for database query
-    card_id_str = str(card_id)
-    
-    result = await db.execute(select(Card).where(Card.id == card_id_str))
+    result = await db.execute(
+        select(Card)
+        .where(Card.id == card_id)
+        .options(selectinload(Card.labels))
+    )
     card = result.scalar_one_or_none()
     
     if not card:
@@ -86,31 +162,27 @@ async def get_card(
             detail="Card not found",
         )
     
-    return CardResponse(
-        id=card.id,
-        board_id=card.board_id,
-        column_id=card.column_id,
-        title=card.title,
-        description=card.description,
-        position=card.position,
-        priority=card.priority,
-        labels=card.labels or [],
-        created_at=card.created_at,
-        updated_at=card.updated_at,
-    )
+    return ModelResponse(CardResponse.from_orm_fast(card))
 
 
-@router.put("/{card_id}", response_model=CardResponse)
+@router.put(
+    "/{card_id}",
+    response_model=None,
+    responses={200: {"model": CardResponse}},
+)
 async def update_card(
     card_id: UUID,
     card_data: CardUpdate,
-    db: AsyncSession = Depends(get_db),
-) -> CardResponse:
+    db: AsyncSession = Depends(get_write_db),
+) -> ModelResponse:
     """Update a card's details (title, description, priority, labels)."""
-    # Convert UUID to string for database query
-    card_id_str = str(card_id)
-    
-    result = await db.execute(select(Card).where(Card.id == card_id_str))
+    # Write the provided scalar fields with one UPDATE that returns the card
+    result = await db.execute(
+        update(Card)
+        .where(Card.id == card_id)
+        .values(**card_data.model_dump(exclude_none=True, exclude={"labels"}))
+        .returning(Card)
+    )
     card = result.scalar_one_or_none()
     
     if not card:
@@ -119,193 +191,118 @@ async def update_card(
             detail="Card not found",
         )
     
-    # Update fields if provided
-    if card_data.title is not None:
-        card.title = card_data.title
-    if card_data.description is not None:
-        card.description = card_data.description
-    if card_data.priority is not None:
-        card.priority = card_data.priority
-    if card_data.labels is not None:
-        card.labels = card_data.labels
+    if card_data.labels is None:
+        # Labels were not sent: keep them and read them for the response
+        result = await db.execute(
+            select(Label)
+            .join(CardLabel, CardLabel.label_id == Label.id)
+            .where(CardLabel.card_id == card.id)
+        )
+        labels = result.scalars().all()
+    else:
+        # Replace the card's labels; they must belong to the card's board
+        result = await db.execute(
+            select(Label)
+            .where(Label.id.in_(card_data.labels))
+            .where(Label.board_id == card.board_id)
+        )
+        labels = result.scalars().all()
+        if len(labels) != len(set(card_data.labels)):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="One or more labels not found",
+            )
+        await db.execute(delete(CardLabel).where(CardLabel.card_id == card.id))
+        if labels:
+            await db.execute(
+                insert(CardLabel),
+                [{"card_id": card.id, "label_id": label.id} for label in labels],
+            )
     
     await db.commit()
-    await db.refresh(card)
+    invalidate_board(card.board_id)
     
-    return CardResponse(
-        id=card.id,
-        board_id=card.board_id,
-        column_id=card.column_id,
-        title=card.title,
-        description=card.description,
-        position=card.position,
-        priority=card.priority,
-        labels=card.labels or [],
-        created_at=card.created_at,
-        updated_at=card.updated_at,
-    )
+    # The association rows are not loaded through the relationship, so attach
+    # the labels for the response without another query
+    set_committed_value(card, "labels", labels)
+
+    return ModelResponse(CardResponse.from_orm_fast(card))
 
 
 @router.delete("/{card_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_card(
     card_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_write_db),
 ) -> None:
     """Delete a card."""
-    # Convert UUID to string for database query
-    card_id_str = str(card_id)
-    
-    result = await db.execute(select(Card).where(Card.id == card_id_str))
-    card = result.scalar_one_or_none()
-    
-    if not card:
+    # Positions are sparse, so the rest of the column is left untouched;
+    # card_labels rows go with the card via ON DELETE CASCADE
+    result = await db.execute(
+        delete(Card).where(Card.id == card_id).returning(Card.board_id)
+    )
+    board_id = result.scalar_one_or_none()
+
+    if board_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Card not found",
         )
-    
-    # Store the column_id and position before deleting
-    column_id = card.column_id
-    deleted_position = card.position
-    
-    # Delete the card
-    await db.delete(card)
-    
-    # Reposition remaining cards in the column
-    result = await db.execute(
-        select(Card)
-        .where(Card.column_id == column_id)
-        .where(Card.position > deleted_position)
-        .order_by(Card.position)
-    )
-    cards_to_update = result.scalars().all()
-    
-    for card in cards_to_update:
-        card.position -= 1
-    
+
     await db.commit()
+    invalidate_board(board_id)
 
 
-@router.post("/{card_id}/move", response_model=CardResponse)
+@router.post(
+    "/{card_id}/move",
+    response_model=None,
+    responses={200: {"model": CardResponse}},
+)
 async def move_card(
     card_id: UUID,
     move_data: CardMove,
-    db: AsyncSession = Depends(get_db),
-) -> CardResponse:
+    db: AsyncSession = Depends(get_write_db),
+) -> ModelResponse:
     """Move a card to a different column and/or position."""
-    # Convert UUIDs to strings for database queries
-    card_id_str = str(card_id)
-    new_column_id_str = str(move_data.column_id)
-    
-    # Fetch the card
-    result = await db.execute(select(Card).where(Card.id == card_id_str))
-    card = result.scalar_one_or_none()
-    
-    if not card:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Card not found",
-        )
-    
-    # Check if the new column exists
-    result = await db.execute(select(Column).where(Column.id == new_column_id_str))
-    new_column = result.scalar_one_or_none()
+    new_column_id = move_data.column_id
     
-    if not new_column:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Target column not found",
-        )
-    
-    # Store old position and column
-    old_column_id = card.column_id
-    old_position = card.position
-    new_position = move_data.position
-    
-    # Moving within the same column
-    if old_column_id == new_column_id_str:
-        if old_position == new_position:
-            # No change needed
-            return CardResponse(
-                id=card.id,
-                board_id=card.board_id,
-                column_id=card.column_id,
-                title=card.title,
-                description=card.description,
-                position=card.position,
-                priority=card.priority,
-                labels=card.labels or [],
-                created_at=card.created_at,
-                updated_at=card.updated_at,
-            )
-        
-        # Get all cards in the column
-        result = await db.execute(
-            select(Card)
-            .where(Card.column_id == old_column_id)
-            .where(Card.id != card_id_str)
-            .order_by(Card.position)
-        )
-        other_cards = result.scalars().all()
-        
-        # Update positions
-        if new_position < old_position:
-            # Moving up: shift cards down between new_position and old_position
-            for other_card in other_cards:
-                if new_position <= other_card.position < old_position:
-                    other_card.position += 1
-        else:
-            # Moving down: shift cards up between old_position and new_position
-            for other_card in other_cards:
-                if old_position < other_card.position <= new_position:
-                    other_card.position -= 1
-        
-        # Update the card's position
-        card.position = new_position
-    
-    # Moving to a different column
-    else:
-        # Update positions in the old column (shift cards up)
+    # Any renumbering and the card update commit as one transaction
+    async with db.begin():
+        # Fetch the card and the target column's board in one query
         result = await db.execute(
-            select(Card)
-            .where(Card.column_id == old_column_id)
-            .where(Card.position > old_position)
-            .order_by(Card.position)
+            select(Card, Column.board_id)
+            .outerjoin(Column, Column.id == new_column_id)
+            .where(Card.id == card_id)
+            .options(selectinload(Card.labels))
         )
-        old_column_cards = result.scalars().all()
-        
-        for other_card in old_column_cards:
-            other_card.position -= 1
-        
-        # Update positions in the new column (shift cards down)
-        result = await db.execute(
-            select(Card)
-            .where(Card.column_id == new_column_id_str)
-            .where(Card.position >= new_position)
-            .order_by(Card.position)
+        row = result.one_or_none()
+
+        if not row:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Card not found",
+            )
+
+        card, target_board_id = row
+
+        if target_board_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Target column not found",
+            )
+
+        if target_board_id != card.board_id:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Target column belongs to a different board",
+            )
+
+        # Place the card between its new neighbours; position in the request
+        # is the index within the target column
+        card.position = await _position_at(
+            db, new_column_id, card_id, move_data.position
         )
-        new_column_cards = result.scalars().all()
-        
-        for other_card in new_column_cards:
-            other_card.position += 1
-        
-        # Update the card's column and position
-        card.column_id = new_column_id_str
-        card.position = new_position
-    
-    # Commit all changes
-    await db.commit()
-    await db.refresh(card)
-    
-    return CardResponse(
-        id=card.id,
-        board_id=card.board_id,
-        column_id=card.column_id,
-        title=card.title,
-        description=card.description,
-        position=card.position,
-        priority=card.priority,
-        labels=card.labels or [],
-        created_at=card.created_at,
-        updated_at=card.updated_at,
-    )
+        card.column_id = new_column_id
+
+    invalidate_board(card.board_id)
+
+    return ModelResponse(CardResponse.from_orm_fast(card))
@@ -1,18 +1,20 @@
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import case, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
-from app.database import get_db
+from app.cache import invalidate_board
+from app.database import get_write_db
 from app.models import Board, Column, Card
+from app.responses import ModelResponse, ORJSONResponse
 from app.schemas import (
     ColumnCreate,
     ColumnUpdate,
     ColumnResponse,
     ColumnReorder,
-    CardResponse,
 )
 
 router = APIRouter(prefix="/api", tags=["columns"])
@@ -21,74 +23,141 @@ router = APIRouter(prefix="/api", tags=["columns"])
 @router.post(
     "/boards/{board_id}/columns",
     status_code=status.HTTP_201_CREATED,
-    response_model=ColumnResponse,
+    response_model=None,
+    responses={201: {"model": ColumnResponse}},
 )
 async def create_column(
     board_id: UUID,
     column_data: ColumnCreate,
-    db: AsyncSession = Depends(get_db),
-) -> ColumnResponse:
+    db: AsyncSession = Depends(get_write_db),
+) -> ModelResponse:
     """Create a new column in a board."""
-    # Convert UUID to string for database query
-    board_id_str = str(board_id)
-
     # Check if board exists
-    board_result = await db.execute(select(Board).where(Board.id == board_id_str))
-    board = board_result.scalar_one_or_none()
+    board_result = await db.execute(select(Board.id).where(Board.id == board_id))
 
-    if not board:
+    if board_result.scalar_one_or_none() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Board not found",
         )
 
     # Get the max position for existing columns
-    position_result = await db.execute(
-        select(Column.position).where(Column.board_id == board_id_str)
+    max_position_result = await db.execute(
+        select(func.coalesce(func.max(Column.position), -1)).where(
+            Column.board_id == board_id
+        )
     )
-    positions = position_result.scalars().all()
-    new_position = max(positions) + 1 if positions else 0
+    new_position = max_position_result.scalar_one() + 1
 
     # Create the column
     column = Column(
-        board_id=board_id_str,
+        board_id=board_id,
         name=column_data.name,
         color=column_data.color or "#6B7280",  # Default color if not provided
         position=new_position,
+        cards=[],
     )
     db.add(column)
     await db.commit()
-    await db.refresh(column)
-
-    return ColumnResponse(
-        id=column.id,
-        board_id=column.board_id,
-        name=column.name,
-        position=column.position,
-        color=column.color,
-        cards=[],
+    invalidate_board(board_id)
+
+    return ModelResponse(
+        ColumnResponse.from_orm_fast(column), status_code=status.HTTP_201_CREATED
+    )
+
+
+# Declared before /columns/{column_id}, which would otherwise match "reorder"
+# as a column id
+@router.put(
+    "/columns/reorder",
+    response_model=None,
+    responses={200: {"model": list[ColumnResponse]}},
+)
+async def reorder_columns(
+    reorder_data: ColumnReorder,
+    db: AsyncSession = Depends(get_write_db),
+) -> ORJSONResponse:
+    """
+    Bulk reorder columns.
+    All columns must belong to the same board.
+    Update the position of each column to match its index in the array.
+    """
+    if not reorder_data.column_ids:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="column_ids list cannot be empty",
+        )
+
+    # Validation and the position update run in one transaction
+    async with db.begin():
+        # Fetch only the fields needed for validation and the response
+        columns_result = await db.execute(
+            select(Column.id, Column.board_id, Column.name, Column.color).where(
+                Column.id.in_(reorder_data.column_ids)
+            )
+        )
+        columns = {row.id: row for row in columns_result.all()}
+
+        # Validate all columns exist
+        if len(columns) != len(reorder_data.column_ids):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="One or more columns not found",
+            )
+
+        # Check all columns belong to the same board
+        board_ids = {row.board_id for row in columns.values()}
+        if len(board_ids) > 1:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="All columns must belong to the same board",
+            )
+
+        # Update all positions in one statement
+        new_position = case(
+            *(
+                (Column.id == column_id, position)
+                for position, column_id in enumerate(reorder_data.column_ids)
+            )
+        )
+        await db.execute(
+            update(Column)
+            .where(Column.id.in_(reorder_data.column_ids))
+            .values(position=new_position)
+            .execution_options(synchronize_session=False)
+        )
+
+    invalidate_board(board_ids.pop())
+
+    # Build response in the new order
+    return ORJSONResponse(
+        [
+            {
+                "id": columns[column_id].id,
+                "board_id": columns[column_id].board_id,
+                "name": columns[column_id].name,
+                "position": position,
+                "color": columns[column_id].color,
+                "cards": [],
+            }
+            for position, column_id in enumerate(reorder_data.column_ids)
+        ]
     )
 
 
 @router.put(
     "/columns/{column_id}",
-    response_model=ColumnResponse,
+    response_model=None,
+    responses={200: {"model": ColumnResponse}},
 )
 async def update_column(
     column_id: UUID,
     column_data: ColumnUpdate,
-    db: AsyncSession = Depends(get_db),
-) -> ColumnResponse:
+    db: AsyncSession = Depends(get_write_db),
+) -> ModelResponse:
     """Update column name and/or color."""
-    # Convert UUID to string for database query
-    column_id_str = str(column_id)
-
-    result = await db.execute(
-        select(Column)
-        .where(Column.id == column_id_str)
-        .options(selectinload(Column.cards))
-    )
-    column = result.unique().scalar_one_or_none()
+    result = await db.execute(select(Column).where(Column.id == column_id))
+    column = result.scalar_one_or_none()
 
     if not column:
         raise HTTPException(
@@ -102,34 +171,23 @@ async def update_column(
     if column_data.color is not None:
         column.color = column_data.color
 
-    await db.commit()
-    await db.refresh(column)
-
-    # Build response
-    cards_response = [
-        CardResponse(
-            id=card.id,
-            board_id=card.board_id,
-            column_id=card.column_id,
-            title=card.title,
-            description=card.description,
-            position=card.position,
-            priority=card.priority,
-            labels=card.labels or [],
-            created_at=card.created_at,
-            updated_at=card.updated_at,
-        )
-        for card in sorted(column.cards, key=lambda c: c.position)
-    ]
-
-    return ColumnResponse(
-        id=column.id,
-        board_id=column.board_id,
-        name=column.name,
-        position=column.position,
-        color=column.color,
-        cards=cards_response,
+    # Cards are only needed for the response; the (column_id, position)
+    # index serves the ordering
+    cards_result = await db.execute(
+        select(Card)
+        .where(Card.column_id == column_id)
+        .order_by(Card.position)
+        .options(selectinload(Card.labels))
     )
+    cards = cards_result.scalars().all()
+
+    await db.commit()
+    invalidate_board(column.board_id)
+
+    # Attach the loaded cards so the response can read column.cards
+    set_committed_value(column, "cards", cards)
+
+    return ModelResponse(ColumnResponse.from_orm_fast(column))
 
 
 @router.delete(
@@ -138,133 +196,68 @@ async def update_column(
 )
 async def delete_column(
     column_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_write_db),
 ) -> None:
     """
     Delete a column.
     If not the last column in the board, move all its cards to the first remaining column.
     If it's the last column, delete all its cards too.
-    Update positions of remaining cards to close gaps.
-    """
-    # Convert UUID to string for database query
-    column_id_str = str(column_id)
-
-    # Fetch the column with its cards and the board info
-    column_result = await db.execute(
-        select(Column)
-        .where(Column.id == column_id_str)
-        .options(selectinload(Column.cards))
-    )
-    column = column_result.unique().scalar_one_or_none()
-
-    if not column:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Column not found",
-        )
-
-    board_id = column.board_id
-
-    # Get all columns in the board
-    board_result = await db.execute(
-        select(Column).where(Column.board_id == board_id)
-    )
-    all_columns = board_result.scalars().all()
-
-    # Check if this is the last column
-    is_last_column = len(all_columns) == 1
-
-    if is_last_column:
-        # Delete all cards in this column
-        for card in column.cards:
-            await db.delete(card)
-    else:
-        # Move cards to the first remaining column
-        # Find the first column by position (excluding this one)
-        remaining_columns = [c for c in all_columns if c.id != column_id_str]
-        target_column = min(remaining_columns, key=lambda c: c.position)
-
-        # Get max position in target column
-        max_position_result = await db.execute(
-            select(Card.position).where(Card.column_id == target_column.id)
-        )
-        positions = max_position_result.scalars().all()
-        next_position = max(positions) + 1 if positions else 0
-
-        # Move all cards from this column to target column
-        for idx, card in enumerate(column.cards):
-            card.column_id = target_column.id
-            card.position = next_position + idx
-
-    # Delete the column
-    await db.delete(column)
-    await db.commit()
-
-
-@router.put(
-    "/columns/reorder",
-    response_model=list[ColumnResponse],
-)
-async def reorder_columns(
-    reorder_data: ColumnReorder,
-    db: AsyncSession = Depends(get_db),
-) -> list[ColumnResponse]:
-    """
-    Bulk reorder columns.
-    All columns must belong to the same board.
-    Update the position of each column to match its index in the array.
     """
-    if not reorder_data.column_ids:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="column_ids list cannot be empty",
-        )
-
-    # Column IDs are already strings
-    column_ids = reorder_data.column_ids
-
-    # Fetch all specified columns
-    columns_result = await db.execute(
-        select(Column).where(Column.id.in_(column_ids))
-    )
-    columns = {col.id: col for col in columns_result.scalars().all()}
-
-    # Validate all columns exist
-    if len(columns) != len(column_ids):
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="One or more columns not found",
-        )
-
-    # Check all columns belong to the same board
-    board_ids = {col.board_id for col in columns.values()}
-    if len(board_ids) > 1:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="All columns must belong to the same board",
-        )
-
-    # Update positions
-    updated_columns = []
-    for position, column_id in enumerate(column_ids):
-        col = columns[column_id]
-        col.position = position
-        updated_columns.append(col)
-
-    await db.commit()
-
-    # Sort by new position for response
-    updated_columns.sort(key=lambda c: c.position)
-
-    # Build response
-    return [
-        ColumnResponse(
-            id=col.id,
-            board_id=col.board_id,
-            name=col.name,
-            position=col.position,
-            color=col.color,
-            cards=[],
+    # Moving the cards and deleting the column commit as one transaction
+    async with db.begin():
+        # Fetch the column; its cards are never loaded into the session
+        column_result = await db.execute(select(Column).where(Column.id == column_id))
+        column = column_result.scalar_one_or_none()
+
+        if not column:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Column not found",
+            )
+
+        board_id = column.board_id
+
+        # Find the first remaining column by position; none means this is
+        # the last column in the board
+        target_result = await db.execute(
+            select(Column.id)
+            .where(Column.board_id == board_id)
+            .where(Column.id != column_id)
+            .order_by(Column.position)
+            .limit(1)
         )
-        for col in updated_columns
-    ]
+        target_column_id = target_result.scalar_one_or_none()
+
+        if target_column_id is not None:
+            # Card positions are sparse and may be negative, so offset the moved
+            # cards by the gap between the target's last card and the source's
+            # first card; this appends them after the target's cards in order
+            bounds_result = await db.execute(
+                select(
+                    select(func.coalesce(func.max(Card.position), -1))
+                    .where(Card.column_id == target_column_id)
+                    .scalar_subquery(),
+                    select(func.coalesce(func.min(Card.position), 0))
+                    .where(Card.column_id == column_id)
+                    .scalar_subquery(),
+                )
+            )
+            target_last, source_first = bounds_result.one()
+            offset = target_last + 1 - source_first
+
+            # Move all cards from this column to target column in one UPDATE
+            await db.execute(
+                update(Card)
+                .where(Card.column_id == column_id)
+                .values(
+                    column_id=target_column_id,
+                    position=Card.position + offset,
+                )
+                .execution_options(synchronize_session=False)
+            )
+
+        # Delete the column; any cards still in it (last column case) are
+        # removed by the ON DELETE CASCADE foreign key
+        await db.delete(column)
+
+    invalidate_board(board_id)
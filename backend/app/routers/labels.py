@@ -1,97 +1,142 @@
 from typing import List
+from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.cache import (
+    board_known_to_exist,
+    forget_board,
+    invalidate_board,
+    remember_board_exists,
+)
+from app.database import get_read_db, get_write_db
 from app.models import Board, Label
+from app.responses import ModelResponse, ORJSONResponse
 from app.schemas import LabelCreate, LabelResponse, LabelUpdate
 
 router = APIRouter()
 
 
-@router.get("/api/boards/{board_id}/labels", response_model=List[LabelResponse])
-async def get_labels(
-    board_id: str,
-    db: AsyncSession = Depends(get_db),
-) -> List[Label]:
-    """Get all labels for a board."""
-    # Verify board exists
-    result = await db.execute(select(Board).where(Board.id == board_id))
-    board = result.scalar_one_or_none()
-    if not board:
+async def _ensure_board_exists(db: AsyncSession, board_id: UUID) -> None:
+    """Raise 404 unless the board exists, selecting only its id."""
+    if board_known_to_exist(board_id):
+        return
+
+    result = await db.execute(select(Board.id).where(Board.id == board_id))
+    if result.scalar_one_or_none() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Board not found",
         )
+    remember_board_exists(board_id)
+
+
+def _failed_constraint(exc: IntegrityError) -> str:
+    """Return the kind of constraint SQLite reported as failed, e.g. "UNIQUE"
+    or "FOREIGN KEY"."""
+    return str(exc.orig).partition(" constraint failed")[0]
+
+
+@router.get(
+    "/api/boards/{board_id}/labels",
+    response_model=None,
+    responses={200: {"model": List[LabelResponse]}},
+)
+async def get_labels(
+    board_id: UUID,
+    db: AsyncSession = Depends(get_read_db),
+) -> ORJSONResponse:
+    """Get all labels for a board."""
+    await _ensure_board_exists(db, board_id)
 
     # Get all labels for the board
     result = await db.execute(
-        select(Label)
+        select(Label.id, Label.name, Label.color)
         .where(Label.board_id == board_id)
         .order_by(Label.name)
     )
-    labels = result.scalars().all()
-    return list(labels)
+    return ORJSONResponse(
+        [{"id": row.id, "name": row.name, "color": row.color} for row in result.all()]
+    )
 
 
 @router.post(
     "/api/boards/{board_id}/labels",
-    response_model=LabelResponse,
+    response_model=None,
+    responses={201: {"model": LabelResponse}},
     status_code=status.HTTP_201_CREATED,
 )
 async def create_label(
-    board_id: str,
+    board_id: UUID,
     label_data: LabelCreate,
-    db: AsyncSession = Depends(get_db),
-) -> Label:
+    db: AsyncSession = Depends(get_write_db),
+) -> ModelResponse:
     """Create a new label for a board."""
-    # Verify board exists
-    result = await db.execute(select(Board).where(Board.id == board_id))
-    board = result.scalar_one_or_none()
-    if not board:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Board not found",
-        )
+    await _ensure_board_exists(db, board_id)
 
-    # Check if a label with the same name already exists in this board
-    result = await db.execute(
-        select(Label).where(
-            Label.board_id == board_id,
-            Label.name == label_data.name,
-        )
-    )
-    existing_label = result.scalar_one_or_none()
-    if existing_label:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Label with name '{label_data.name}' already exists in this board",
-        )
-
-    # Create the label
+    # Create the label; the unique (board_id, name) index rejects duplicates
     new_label = Label(
         board_id=board_id,
         name=label_data.name,
         color=label_data.color,
     )
     db.add(new_label)
-    await db.commit()
-    await db.refresh(new_label)
+    try:
+        await db.commit()
+    except IntegrityError as exc:
+        await db.rollback()
+        constraint = _failed_constraint(exc)
+        if constraint == "UNIQUE":
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Label with name '{label_data.name}' already exists in this board",
+            )
+        if constraint == "FOREIGN KEY":
+            # The board was deleted after it was remembered as existing
+            forget_board(board_id)
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Board not found",
+            )
+        raise
 
-    return new_label
+    return ModelResponse(
+        LabelResponse.from_orm_fast(new_label), status_code=status.HTTP_201_CREATED
+    )
 
 
-@router.put("/api/labels/{label_id}", response_model=LabelResponse)
+@router.put(
+    "/api/labels/{label_id}",
+    response_model=None,
+    responses={200: {"model": LabelResponse}},
+)
 async def update_label(
-    label_id: str,
+    label_id: UUID,
     label_data: LabelUpdate,
-    db: AsyncSession = Depends(get_db),
-) -> Label:
+    db: AsyncSession = Depends(get_write_db),
+) -> ModelResponse:
     """Update a label."""
-    # Get the label
-    result = await db.execute(select(Label).where(Label.id == label_id))
+    # Update the label and read it back in one statement; the unique
+    # (board_id, name) index rejects a name used by another label
+    try:
+        result = await db.execute(
+            update(Label)
+            .where(Label.id == label_id)
+            .values(**label_data.model_dump(exclude_unset=True))
+            .returning(Label)
+        )
+    except IntegrityError as exc:
+        await db.rollback()
+        if _failed_constraint(exc) != "UNIQUE":
+            raise
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Label with name '{label_data.name}' already exists in this board",
+        )
+
     label = result.scalar_one_or_none()
     if not label:
         raise HTTPException(
@@ -99,36 +144,17 @@ async def update_label(
             detail="Label not found",
         )
 
-    # If updating the name, check for duplicates
-    if label_data.name is not None and label_data.name != label.name:
-        result = await db.execute(
-            select(Label).where(
-                Label.board_id == label.board_id,
-                Label.name == label_data.name,
-            )
-        )
-        existing_label = result.scalar_one_or_none()
-        if existing_label:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Label with name '{label_data.name}' already exists in this board",
-            )
-
-    # Update fields
-    update_data = label_data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(label, field, value)
-
     await db.commit()
-    await db.refresh(label)
+    # Card labels are part of the cached board detail
+    invalidate_board(label.board_id)
 
-    return label
+    return ModelResponse(LabelResponse.from_orm_fast(label))
 
 
 @router.delete("/api/labels/{label_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_label(
-    label_id: str,
-    db: AsyncSession = Depends(get_db),
+    label_id: UUID,
+    db: AsyncSession = Depends(get_write_db),
 ) -> None:
     """Delete a label."""
     # Get the label
@@ -143,3 +169,4 @@ async def delete_label(
     # Delete the label
     await db.delete(label)
     await db.commit()
+    invalidate_board(label.board_id)
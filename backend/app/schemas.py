@@ -1,16 +1,32 @@
-from datetime import datetime
+from typing import Literal
+from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, NaiveDatetime
+from pydantic.dataclasses import dataclass
+
+# Config shared by every response model. defer_build leaves core schema
+# generation to model_rebuild at startup instead of import time. Request
+# models are built by FastAPI when the routes are registered, so deferring
+# them gains nothing.
+_RESPONSE_CONFIG = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
+
+Priority = Literal["none", "low", "medium", "high", "urgent"]
 
 
 # Request Models
-class BoardCreate(BaseModel):
+#
+# The smallest bodies (board and label writes) are pydantic dataclasses, which
+# are cheaper to construct than BaseModel instances. Bodies that routes dump
+# with model_dump stay BaseModels.
+@dataclass
+class BoardCreate:
     """Request model for creating a board."""
 
     name: str
 
 
-class BoardUpdate(BaseModel):
+@dataclass
+class BoardUpdate:
     """Request model for updating a board."""
 
     name: str
@@ -33,13 +49,13 @@ class ColumnUpdate(BaseModel):
 class ColumnReorder(BaseModel):
     """Request model for reordering columns."""
 
-    column_ids: list[str]
+    column_ids: list[UUID]
 
 
 class CardCreate(BaseModel):
     """Request model for creating a card."""
 
-    column_id: str
+    column_id: UUID
     title: str
     description: str | None = None
 
@@ -49,18 +65,19 @@ class CardUpdate(BaseModel):
 
     title: str | None = None
     description: str | None = None
-    priority: str
-    labels: list
+    priority: Priority
+    labels: list[UUID] | None = None
 
 
 class CardMove(BaseModel):
     """Request model for moving a card."""
 
-    column_id: str
+    column_id: UUID
     position: int
 
 
-class LabelCreate(BaseModel):
+@dataclass
+class LabelCreate:
     """Request model for creating a label."""
 
     name: str
@@ -75,63 +92,96 @@ class LabelUpdate(BaseModel):
 
 
 # Response Models
+#
+# Responses are built from database rows that were validated on the way in,
+# so from_orm_fast reads attributes directly into model_construct instead of
+# running model_validate. model_construct does not recurse, so nested models
+# are built explicitly. Responses are frozen: nothing mutates them once built.
 class LabelResponse(BaseModel):
     """Response model for a label."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = _RESPONSE_CONFIG
 
-    id: str = Field(serialization_alias="id")
+    id: UUID
     name: str
     color: str
 
+    @classmethod
+    def from_orm_fast(cls, label) -> "LabelResponse":
+        """Build the response from a Label row without validation."""
+        return cls.model_construct(id=label.id, name=label.name, color=label.color)
+
 
 class CardResponse(BaseModel):
     """Response model for a card."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = _RESPONSE_CONFIG
 
-    id: str = Field(serialization_alias="id")
-    board_id: str
-    column_id: str
+    id: UUID
+    board_id: UUID
+    column_id: UUID
     title: str
     description: str | None
-    position: int
-    priority: str
-    labels: list
-    created_at: datetime
-    updated_at: datetime
+    position: float
+    priority: Priority
+    labels: list[LabelResponse] = Field(default_factory=list)
+    created_at: NaiveDatetime
+    updated_at: NaiveDatetime
+
+    @classmethod
+    def from_orm_fast(cls, card) -> "CardResponse":
+        """Build the response from a Card row with its labels loaded."""
+        return cls.model_construct(
+            id=card.id,
+            board_id=card.board_id,
+            column_id=card.column_id,
+            title=card.title,
+            description=card.description,
+            position=card.position,
+            priority=card.priority,
+            labels=[LabelResponse.from_orm_fast(label) for label in card.labels],
+            created_at=card.created_at,
+            updated_at=card.updated_at,
+        )
 
 
 class ColumnResponse(BaseModel):
     """Response model for a column."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = _RESPONSE_CONFIG
 
-    id: str = Field(serialization_alias="id")
-    board_id: str
+    id: UUID
+    board_id: UUID
     name: str
     position: int
     color: str
-    cards: list[CardResponse] = []
+    cards: list[CardResponse] = Field(default_factory=list)
+
+    @classmethod
+    def from_orm_fast(cls, column) -> "ColumnResponse":
+        """Build the response from a Column row with its cards loaded."""
+        return cls.model_construct(
+            id=column.id,
+            board_id=column.board_id,
+            name=column.name,
+            position=column.position,
+            color=column.color,
+            cards=[CardResponse.from_orm_fast(card) for card in column.cards],
+        )
 
 
 class BoardResponse(BaseModel):
     """Response model for a board."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = _RESPONSE_CONFIG
 
-    id: str = Field(serialization_alias="id")
+    id: UUID
     name: str
-    created_at: datetime
+    created_at: NaiveDatetime
 
 
-class BoardDetailResponse(BaseModel):
+class BoardDetailResponse(BoardResponse):
     """Detailed response model for a board with all columns and cards."""
 
-    model_config = ConfigDict(from_attributes=True)
-
-    id: str = Field(serialization_alias="id")
-    name: str
-    created_at: datetime
-    updated_at: datetime
-    columns: list[ColumnResponse] = []
+    updated_at: NaiveDatetime
+    columns: list[ColumnResponse] = Field(default_factory=list)
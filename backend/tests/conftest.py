@@ -0,0 +1,49 @@
+import os
+from contextlib import contextmanager
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+
+@pytest.fixture(scope="session")
+def client(tmp_path_factory):
+    """A client for the app, backed by a fresh database file."""
+    # The engines open baudboard.db relative to the working directory
+    os.chdir(tmp_path_factory.mktemp("db"))
+
+    from app.main import app
+
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture
+def count_queries():
+    """
+    Return a context manager that records every SQL statement the app runs
+    inside it:
+
+        with count_queries() as queries:
+            client.get(...)
+        assert len(queries) == 4
+    """
+    from app.database import read_engine, write_engine
+
+    @contextmanager
+    def counter():
+        queries = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            queries.append(statement)
+
+        engines = (write_engine.sync_engine, read_engine.sync_engine)
+        for engine in engines:
+            event.listen(engine, "before_cursor_execute", record)
+        try:
+            yield queries
+        finally:
+            for engine in engines:
+                event.remove(engine, "before_cursor_execute", record)
+
+    return counter
@@ -0,0 +1,41 @@
+from uuid import uuid4
+
+from app import cache
+
+
+def test_deleted_board_leaves_nothing_behind():
+    board_id = uuid4()
+    cache.invalidate_board(board_id)
+    cache.set_board_detail(board_id, cache.board_version(board_id), b"{}")
+
+    cache.discard_board(board_id)
+
+    assert board_id not in cache._board_versions
+    assert not any(key[0] == board_id for key in cache._board_details)
+
+
+def test_read_racing_a_delete_is_not_served():
+    board_id = uuid4()
+    # The read takes its version, then the board is deleted before it stores
+    version = cache.board_version(board_id)
+    cache.discard_board(board_id)
+    cache.set_board_detail(board_id, version, b"stale")
+
+    assert cache.get_board_detail(board_id, cache.board_version(board_id)) is None
+
+
+def test_versions_are_bounded(monkeypatch):
+    monkeypatch.setattr(cache, "MAX_VERSIONED_BOARDS", 3)
+    evicted = uuid4()
+    cache.invalidate_board(evicted)
+    version = cache.board_version(evicted)
+    cache.set_board_detail(evicted, version, b"old")
+
+    for _ in range(5):
+        cache.invalidate_board(uuid4())
+
+    assert len(cache._board_versions) <= 3
+    # The evicted board falls back to the floor version, which is newer than
+    # the one its cached detail was stored under
+    assert cache.board_version(evicted) > version
+    assert cache.get_board_detail(evicted, cache.board_version(evicted)) is None
@@ -0,0 +1,122 @@
+
+def _create_column(client, titles: list[str]) -> tuple[str, dict[str, str]]:
+    """Create a board and fill its first column with cards, returning the
+    board id and the card ids by title."""
+    board = client.post("/api/boards", json={"name": "Cards"}).json()
+    column_id = board["columns"][0]["id"]
+    card_ids = {}
+    for title in titles:
+        response = client.post(
+            "/api/cards", json={"column_id": column_id, "title": title}
+        )
+        card_ids[title] = response.json()["id"]
+    return board["id"], card_ids
+
+
+def _column_cards(client, board_id: str, index: int = 0) -> list[dict]:
+    board = client.get(f"/api/boards/{board_id}").json()
+    return board["columns"][index]["cards"]
+
+
+def _titles(client, board_id: str, index: int = 0) -> list[str]:
+    return [card["title"] for card in _column_cards(client, board_id, index)]
+
+
+def _move(client, card_id: str, column_id: str, position: int) -> dict:
+    response = client.post(
+        f"/api/cards/{card_id}/move",
+        json={"column_id": column_id, "position": position},
+    )
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_move_to_top(client):
+    board_id, card_ids = _create_column(client, ["a", "b", "c"])
+    column_id = client.get(f"/api/boards/{board_id}").json()["columns"][0]["id"]
+
+    _move(client, card_ids["c"], column_id, 0)
+
+    assert _titles(client, board_id) == ["c", "a", "b"]
+
+
+def test_move_between_neighbours(client):
+    board_id, card_ids = _create_column(client, ["a", "b"])
+    board = client.get(f"/api/boards/{board_id}").json()
+    column_id = board["columns"][0]["id"]
+    card = client.post(
+        "/api/cards", json={"column_id": board["columns"][1]["id"], "title": "x"}
+    ).json()
+
+    _move(client, card["id"], column_id, 1)
+
+    assert _titles(client, board_id) == ["a", "x", "b"]
+    assert _titles(client, board_id, 1) == []
+
+
+def test_move_past_end(client):
+    board_id, card_ids = _create_column(client, ["a", "b", "c"])
+    column_id = client.get(f"/api/boards/{board_id}").json()["columns"][0]["id"]
+
+    _move(client, card_ids["a"], column_id, 10)
+
+    assert _titles(client, board_id) == ["b", "c", "a"]
+
+
+def test_move_down_within_column(client):
+    board_id, card_ids = _create_column(client, ["a", "b", "c", "d"])
+    column_id = client.get(f"/api/boards/{board_id}").json()["columns"][0]["id"]
+
+    # The index counts the other cards, so 2 lands after b and c
+    _move(client, card_ids["a"], column_id, 2)
+
+    assert _titles(client, board_id) == ["b", "c", "a", "d"]
+
+
+def test_repeated_moves_renumber_the_column(client):
+    # Imported here: the app must not load before the client fixture has
+    # moved into the test database directory
+    from app.routers.cards import MIN_POSITION_GAP
+
+    board_id, _ = _create_column(client, ["first", "last"])
+    board = client.get(f"/api/boards/{board_id}").json()
+    column_id = board["columns"][0]["id"]
+    source_id = board["columns"][1]["id"]
+
+    # Each move halves the gap after "first" until it drops below
+    # MIN_POSITION_GAP and the column is renumbered
+    moves = 0
+    gap = 1.0
+    while gap >= MIN_POSITION_GAP / 4:
+        card = client.post(
+            "/api/cards", json={"column_id": source_id, "title": f"m{moves}"}
+        ).json()
+        _move(client, card["id"], column_id, 1)
+        moves += 1
+        gap /= 2
+
+    cards = _column_cards(client, board_id)
+    assert [card["title"] for card in cards] == (
+        ["first"] + [f"m{i}" for i in reversed(range(moves))] + ["last"]
+    )
+    positions = [card["position"] for card in cards]
+    assert positions == sorted(set(positions))
+    # Renumbering moved "last" off its original position of 1
+    assert positions[-1] > 1
+
+
+def test_move_to_another_board_is_rejected(client):
+    board_id, card_ids = _create_column(client, ["a"])
+    other = client.post("/api/boards", json={"name": "Other"}).json()
+    # Cache the other board's detail before the attempted move
+    client.get(f"/api/boards/{other['id']}")
+
+    response = client.post(
+        f"/api/cards/{card_ids['a']}/move",
+        json={"column_id": other["columns"][0]["id"], "position": 0},
+    )
+    assert response.status_code == 400
+
+    assert _titles(client, board_id) == ["a"]
+    board = client.get(f"/api/boards/{other['id']}").json()
+    assert [len(column["cards"]) for column in board["columns"]] == [0, 0, 0, 0]
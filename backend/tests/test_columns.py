@@ -0,0 +1,23 @@
+def test_reorder_columns(client):
+    board = client.post("/api/boards", json={"name": "Reorder"}).json()
+    column_ids = [column["id"] for column in board["columns"]]
+
+    response = client.put(
+        "/api/columns/reorder", json={"column_ids": column_ids[::-1]}
+    )
+    assert response.status_code == 200
+    assert [column["id"] for column in response.json()] == column_ids[::-1]
+
+    board = client.get(f"/api/boards/{board['id']}").json()
+    assert [column["id"] for column in board["columns"]] == column_ids[::-1]
+
+
+def test_reorder_columns_across_boards(client):
+    first = client.post("/api/boards", json={"name": "First"}).json()
+    second = client.post("/api/boards", json={"name": "Second"}).json()
+
+    response = client.put(
+        "/api/columns/reorder",
+        json={"column_ids": [first["columns"][0]["id"], second["columns"][0]["id"]]},
+    )
+    assert response.status_code == 400
@@ -0,0 +1,31 @@
+from uuid import uuid4
+
+from app.cache import board_known_to_exist, remember_board_exists
+
+
+def test_duplicate_label_name_is_rejected(client):
+    board = client.post("/api/boards", json={"name": "Labels"}).json()
+    url = f"/api/boards/{board['id']}/labels"
+    assert client.post(url, json={"name": "bug", "color": "#f00"}).status_code == 201
+
+    response = client.post(url, json={"name": "bug", "color": "#0f0"})
+    assert response.status_code == 400
+
+    other = client.post(url, json={"name": "feature", "color": "#00f"}).json()
+    response = client.put(
+        f"/api/labels/{other['id']}", json={"name": "bug", "color": "#00f"}
+    )
+    assert response.status_code == 400
+
+
+def test_label_for_board_deleted_after_caching_is_not_found(client):
+    # The existence cache still remembers a board that no longer exists, so
+    # the INSERT fails on the foreign key rather than on the probe
+    board_id = uuid4()
+    remember_board_exists(board_id)
+
+    response = client.post(
+        f"/api/boards/{board_id}/labels", json={"name": "bug", "color": "#f00"}
+    )
+    assert response.status_code == 404
+    assert not board_known_to_exist(board_id)
@@ -0,0 +1,80 @@
+"""
+Statement counts for the hot endpoints, so a new lazy load or per-row query
+shows up as a failing test. Counts include the BEGIN IMMEDIATE that opens
+every write transaction.
+"""
+
+
+def _create_board(client) -> tuple[str, list[str]]:
+    board = client.post("/api/boards", json={"name": "Counts"}).json()
+    return board["id"], [column["id"] for column in board["columns"]]
+
+
+def _create_card(client, column_id: str, title: str = "Card") -> str:
+    response = client.post("/api/cards", json={"column_id": column_id, "title": title})
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def test_get_board_loads_one_statement_per_level(client, count_queries):
+    board_id, column_ids = _create_board(client)
+    label = client.post(
+        f"/api/boards/{board_id}/labels", json={"name": "bug", "color": "#f00"}
+    ).json()
+    for column_id in column_ids[:2]:
+        for i in range(3):
+            card_id = _create_card(client, column_id, f"Card {i}")
+            client.put(
+                f"/api/cards/{card_id}",
+                json={"priority": "high", "labels": [label["id"]]},
+            )
+
+    # Board, columns, cards and labels: one SELECT each, whatever the size
+    with count_queries() as queries:
+        response = client.get(f"/api/boards/{board_id}")
+    assert response.status_code == 200
+    assert len(queries) == 4
+
+    # Served from the board detail cache until the board changes
+    with count_queries() as queries:
+        response = client.get(f"/api/boards/{board_id}")
+    assert response.status_code == 200
+    assert len(queries) == 0
+
+
+def test_create_card(client, count_queries):
+    _, column_ids = _create_board(client)
+    _create_card(client, column_ids[0])
+
+    # BEGIN, the column probe and the INSERT ... RETURNING
+    with count_queries() as queries:
+        _create_card(client, column_ids[0])
+    assert len(queries) == 3
+
+
+def test_move_card(client, count_queries):
+    _, column_ids = _create_board(client)
+    card_id = _create_card(client, column_ids[0])
+    for i in range(3):
+        _create_card(client, column_ids[1], f"Card {i}")
+
+    # BEGIN, the card with the target column probe, its labels, the two
+    # neighbouring positions and the card UPDATE
+    with count_queries() as queries:
+        response = client.post(
+            f"/api/cards/{card_id}/move",
+            json={"column_id": column_ids[1], "position": 1},
+        )
+    assert response.status_code == 200
+    assert len(queries) == 5
+
+
+def test_delete_card(client, count_queries):
+    _, column_ids = _create_board(client)
+    card_id = _create_card(client, column_ids[0])
+
+    # BEGIN and the DELETE ... RETURNING
+    with count_queries() as queries:
+        response = client.delete(f"/api/cards/{card_id}")
+    assert response.status_code == 204
+    assert len(queries) == 2